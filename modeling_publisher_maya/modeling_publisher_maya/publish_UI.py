@@ -1,6 +1,9 @@
-from PySide6 import QtWidgets, QtCore
+import asyncio
+import concurrent.futures
+from PySide6 import QtWidgets, QtCore, QtGui
 import maya.cmds as cmds
 import maya.OpenMayaUI as omui
+import maya.utils
 from publishing import ModelPublisher, PublishError
 
 
@@ -32,6 +35,19 @@ def main():
 class PublishStepWidget(QtWidgets.QWidget):
     """A reusable widget for a single CVEI step."""
 
+    # Indicator stylesheets are built once and shared by every step.
+    STYLES = {
+        status: (
+            f"background-color: {color}; border-radius: 7px; border: 1px solid #222;"
+        )
+        for status, color in {
+            "idle": "#555555",
+            "running": "#FFD700",
+            "success": "#4CAF50",
+            "fail": "#F44336",
+        }.items()
+    }
+
     def __init__(self, label_text, parent=None):
         super(PublishStepWidget, self).__init__(parent)
         layout = QtWidgets.QHBoxLayout(self)
@@ -50,16 +66,138 @@ class PublishStepWidget(QtWidgets.QWidget):
 
     def set_status(self, status):
         """Updates color: idle (grey), running (yellow), success (green), fail (red)"""
-        colors = {
-            "idle": "#555555",
-            "running": "#FFD700",
-            "success": "#4CAF50",
-            "fail": "#F44336",
-        }
-        color = colors.get(status, "#555555")
-        self.indicator.setStyleSheet(
-            f"background-color: {color}; border-radius: 7px; border: 1px solid #222;"
-        )
+        self.indicator.setStyleSheet(self.STYLES.get(status, self.STYLES["idle"]))
+
+
+class AsyncLoopThread(QtCore.QThread):
+    """Keeps one asyncio loop alive on its own thread for the publish coroutines.
+
+    QtAsyncio would replace Maya's event loop, so the loop runs beside it instead.
+    """
+
+    # Threads whose loop did not stop in time, kept alive until they unwind.
+    detached = []
+
+    def __init__(self, parent=None):
+        super(AsyncLoopThread, self).__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self.stopping = False
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def submit(self, coro):
+        """Schedules a coroutine on the loop, returns a concurrent future."""
+        if self.stopping:
+            # The window closed first, the coroutine is never awaited.
+            coro.close()
+            raise RuntimeError("The publish loop is stopped.")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def cancel_pending(self):
+        """Cancels the running publish tasks and waits for them to unwind."""
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self, timeout=5):
+        """Cancels the pending tasks and stops the loop, safe to call more than once."""
+        if self.stopping:
+            return
+        # Drains the pending tasks so their futures resolve before the loop closes.
+        drained = self.submit(self.cancel_pending())
+        self.stopping = True
+        try:
+            drained.result(timeout)
+        except concurrent.futures.TimeoutError:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+        # Never hangs Maya, a blocked loop closes itself once it unwinds.
+        if not self.wait(timeout * 1000):
+            self.setParent(None)
+            AsyncLoopThread.detached.append(self)
+
+
+class PublishSignals(QtCore.QObject):
+    """Signals the PublishWorker sends back to the UI thread."""
+
+    stepStarted = QtCore.Signal(int)
+    stepFinished = QtCore.Signal(int, bool, str)
+    logLine = QtCore.Signal(str, bool)
+    done = QtCore.Signal(bool, str)
+
+
+class PublishWorker(QtCore.QRunnable):
+    """Runs the CVEI steps on the thread pool so Maya's UI stays responsive."""
+
+    # Seconds to wait for the implement step before giving up the pool thread.
+    IMPLEMENT_TIMEOUT = 60
+
+    def __init__(self, selection, api_url, output_format, loop_thread):
+        super(PublishWorker, self).__init__()
+        self.loop_thread = loop_thread
+        self.selection = selection
+        self.api_url = api_url
+        self.output_format = output_format
+        self.signals = PublishSignals()
+
+    def run_in_main(self, func, *args, **kwargs):
+        """Maya commands are not thread safe, dispatch them to the main thread."""
+        return maya.utils.executeInMainThreadWithResult(func, *args, **kwargs)
+
+    def run(self):
+        pub = ModelPublisher(self.selection, self.api_url)
+
+        try:
+            # 1. COLLECT
+            self.signals.stepStarted.emit(0)
+            self.run_in_main(pub.collect_assets)
+            self.signals.stepFinished.emit(0, True, "Step: Collect successful.")
+
+            # 2. VERIFY
+            self.signals.stepStarted.emit(1)
+            # This calls the ModelPublisher override
+            self.run_in_main(pub.verify_assets)
+            self.signals.stepFinished.emit(
+                1, True, "Step: Verification (Topology, Transforms, History) passed."
+            )
+
+            # 3. EXTRACT
+            self.signals.stepStarted.emit(2)
+            self.run_in_main(pub.extract_assets, output=self.output_format)
+            self.signals.stepFinished.emit(
+                2, True, f"Step: Exported to {pub.obj_path} as {self.output_format}."
+            )
+
+            # 4. IMPLEMENT
+            # Pure python I/O, it runs on the shared loop off the main thread.
+            self.signals.stepStarted.emit(3)
+            future = self.loop_thread.submit(pub.implement_assets())
+            try:
+                future.result(timeout=self.IMPLEMENT_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise
+            self.signals.stepFinished.emit(3, True, "Step: Discord notification sent.")
+
+            self.signals.done.emit(True, "Asset Published Successfully!")
+
+        except PublishError as e:
+            self.signals.logLine.emit(f"PUBLISH ERROR: {str(e)}", True)
+            self.signals.done.emit(False, f"Publish failed: {e}")
+
+        except Exception as e:
+            import traceback
+
+            self.signals.logLine.emit(f"CRITICAL SYSTEM ERROR: {str(e)}", True)
+            self.signals.logLine.emit(traceback.format_exc(), True)
+            self.signals.done.emit(False, f"Critical Error: {e}")
 
 
 class PublisherWindow(QtWidgets.QDialog):
@@ -72,6 +210,10 @@ class PublisherWindow(QtWidgets.QDialog):
         self.create_widgets()
         self.create_layout()
 
+        # The asyncio loop lives as long as the window.
+        self.loop_thread = AsyncLoopThread(self)
+        self.loop_thread.start()
+
     def create_widgets(self):
         # Format Selection
         self.format_label = QtWidgets.QLabel("Export Format:")
@@ -94,6 +236,12 @@ class PublisherWindow(QtWidgets.QDialog):
             "background-color: #1a1a1a; color: #dcdcdc; font-family: 'Consolas';"
         )
 
+        # Log formats are built once and reused for every line.
+        self.log_format_ok = QtGui.QTextCharFormat()
+        self.log_format_ok.setForeground(QtGui.QColor("#88ff88"))
+        self.log_format_error = QtGui.QTextCharFormat()
+        self.log_format_error.setForeground(QtGui.QColor("red"))
+
         # Publish Button
         self.publish_btn = QtWidgets.QPushButton("PUBLISH ASSET")
         self.publish_btn.setFixedHeight(40)
@@ -123,11 +271,25 @@ class PublisherWindow(QtWidgets.QDialog):
         main_layout.addWidget(self.publish_btn)
 
     def write_log(self, text, is_error=False):
-        color = "red" if is_error else "#88ff88"
-        self.log_output.appendHtml(f'<span style="color:{color};">{text}</span>')
-        QtCore.QCoreApplication.processEvents()  # Force UI update
+        log_format = self.log_format_error if is_error else self.log_format_ok
+        cursor = self.log_output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        # Starts a new block only between entries, like appendHtml did.
+        if not self.log_output.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text.rstrip("\n"), log_format)
+        self.log_output.setTextCursor(cursor)
+
+    def done(self, result):
+        # Closing, Esc and accept all end here, closeEvent misses reject().
+        # Releases the asyncio loop and the pooled Discord connection.
+        self.loop_thread.stop()
+        ModelPublisher.close()
+        super(PublisherWindow, self).done(result)
 
     def reset_ui(self):
+        # Index of the step that is running, None when no step is active.
+        self.current_step = None
         for step in self.steps:
             step.set_status("idle")
         self.log_output.clear()
@@ -138,56 +300,40 @@ class PublisherWindow(QtWidgets.QDialog):
 
         # Initialize Publisher
         # Note: Replace 'your_shotgrid_api_link' with your actual endpoint
-        pub = ModelPublisher(selection, "http://shotgrid.api.link")
         output_format = self.format_combo.currentText()
+        self.worker = PublishWorker(
+            selection, "http://shotgrid.api.link", output_format, self.loop_thread
+        )
 
-        try:
-            # 1. COLLECT
-            self.step_c.set_status("running")
-            pub.collect_assets()
-            self.step_c.set_status("success")
-            self.write_log("Step: Collect successful.")
-
-            # 2. VERIFY
-            self.step_v.set_status("running")
-            pub.verify_assets()  # This calls the ModelPublisher override
-            self.step_v.set_status("success")
-            self.write_log("Step: Verification (Topology, Transforms, History) passed.")
-
-            # 3. EXTRACT
-            self.step_e.set_status("running")
-            pub.extract_assets(output=output_format)
-            self.step_e.set_status("success")
-            path = pub.obj_path
-            print(path)
-            self.write_log(f"Step: Exported to {path} as {output_format}.")
-
-            # 4. IMPLEMENT
-            self.step_i.set_status("running")
-            pub.implement_assets()
-            self.step_i.set_status("success")
-            self.write_log("Step: Discord notification sent.")
-
-            QtWidgets.QMessageBox.information(
-                self, "Success", "Asset Published Successfully!"
-            )
-
-        except PublishError as e:
-            # Determine where it failed based on status
-            for step in self.steps:
-                if (
-                    step.indicator.styleSheet().find("#FFD700") != -1
-                ):  # if it was running
-                    step.set_status("fail")
-
-            self.write_log(f"PUBLISH ERROR: {str(e)}", is_error=True)
-            cmds.warning(f"Publish failed: {e}")
-
-        except Exception as e:
-            self.write_log(f"CRITICAL SYSTEM ERROR: {str(e)}", is_error=True)
-            import traceback
-
-            self.write_log(traceback.format_exc(), is_error=True)
+        # The slots run on the UI thread, the worker only emits.
+        self.worker.signals.stepStarted.connect(self.on_step_started)
+        self.worker.signals.stepFinished.connect(self.on_step_finished)
+        self.worker.signals.logLine.connect(self.write_log)
+        self.worker.signals.done.connect(self.on_publish_done)
+
+        self.publish_btn.setEnabled(False)
+        QtCore.QThreadPool.globalInstance().start(self.worker)
+
+    def on_step_started(self, index):
+        self.current_step = index
+        self.steps[index].set_status("running")
+
+    def on_step_finished(self, index, ok, text):
+        self.current_step = None
+        self.steps[index].set_status("success" if ok else "fail")
+        self.write_log(text, is_error=not ok)
+
+    def on_publish_done(self, ok, text):
+        self.publish_btn.setEnabled(True)
+        if ok:
+            QtWidgets.QMessageBox.information(self, "Success", text)
+            return
+
+        # The step that was still running is the one that failed.
+        if self.current_step is not None:
+            self.steps[self.current_step].set_status("fail")
+            self.current_step = None
+        cmds.warning(text)
 
 
 if __name__ == "__main__":
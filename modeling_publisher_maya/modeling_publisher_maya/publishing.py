@@ -1,15 +1,91 @@
+import asyncio
+import collections
+import contextlib
+import functools
 import getpass
 import json
+import math
 import maya.cmds as cmds
+import maya.api.OpenMaya as om2
 import os
 import pathlib
-import requests
-import datetime
-import uuid
+import re
+
+# Scene path pieces the publish steps need, resolved once per publish.
+SceneInfo = collections.namedtuple(
+    "SceneInfo", ["file_name", "base_name", "version", "project_dir"]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def name_pattern(prefix):
+    """
+    Description:
+    Compiles the asset naming convention for a prefix.
+    e.g. geo_{asset}_{type}_{subtype}
+
+    Input:
+    prefix (str): The first part every asset name starts with.
+
+    Output:
+    pattern (re.Pattern): Matches the prefix plus two or three more parts.
+    """
+    return re.compile(rf"{re.escape(prefix)}(?:_[^_]*){{2,3}}")
+
+
+def face_ranges(indices):
+    """
+    Description:
+    Compacts sorted face indices into component ranges, e.g. f[10:500].
+
+    Input:
+    indices (list): Sorted face indices.
+
+    Output:
+    ranges (list): One f[a] or f[a:b] string per run of consecutive faces.
+    """
+    ranges = []
+    start = end = None
+    for index in indices:
+        if end is not None and index == end + 1:
+            end = index
+            continue
+        if start is not None:
+            ranges.append(f"f[{start}]" if start == end else f"f[{start}:{end}]")
+        start = end = index
+    if start is not None:
+        ranges.append(f"f[{start}]" if start == end else f"f[{start}:{end}]")
+    return ranges
+
+
+@contextlib.contextmanager
+def maintained_selection(selection):
+    """
+    Description:
+    Sets the active selection for a command and restores the user's one after.
+
+    Input:
+    selection (om2.MSelectionList): The selection the command needs.
+
+    Output:
+    None
+    """
+    previous = om2.MGlobal.getActiveSelectionList()
+    om2.MGlobal.setActiveSelectionList(selection)
+    try:
+        yield
+    finally:
+        om2.MGlobal.setActiveSelectionList(previous)
 
 
 class MyPublisher:
-    def __init__(self, selection, shotgrid_api, prefix="geo"):
+    # Scene file names have three or four parts, e.g. scene_artist_v01.
+    SCENE_PATTERN = re.compile(r"[^_]*(?:_[^_]*){2,3}")
+
+    # Shared between publishes so the webhook connection is kept alive.
+    http = None
+
+    def __init__(self, selection, shotgrid_api, prefix="geo", fast_fail=False):
         """
         Description:
         Initialize the Publisher base class.
@@ -17,6 +93,8 @@ class MyPublisher:
         Input:
         selection (obj): Maya selection of the export.
         shotgrid_api(str): The API link to shotgrid.
+        prefix (str): The prefix every asset name starts with.
+        fast_fail (bool): Stops the naming check on the first wrong name.
 
         Output:
         None
@@ -25,7 +103,59 @@ class MyPublisher:
         self.sel = selection
         self.publish_api = shotgrid_api
         self.prefix = prefix
+        self.fast_fail = fast_fail
         self.obj_path = ""
+        self.metadata_path = ""
+
+    @staticmethod
+    def create_session():
+        """
+        Description:
+        Builds a requests session with connection pooling and retries.
+
+        Input:
+        None
+
+        Output:
+        session (requests.Session): The session used for the web requests.
+        """
+        # Imported on first publish to keep the tool light to load.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=2,
+            max_retries=Retry(
+                total=2,
+                # POST is not retried by default, a webhook post is safe to repeat.
+                allowed_methods=frozenset({"POST"}),
+                status_forcelist=(429, 500, 502, 503, 504),
+                backoff_factor=0.3,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def close():
+        """
+        Description:
+        Closes the shared session and its pooled connections.
+
+        Input:
+        None
+
+        Output:
+        None
+        """
+        # Always the base class attribute, subclasses would shadow it otherwise.
+        if MyPublisher.http is not None:
+            MyPublisher.http.close()
+            MyPublisher.http = None
 
     def main(self):
         """
@@ -46,7 +176,7 @@ class MyPublisher:
             self.collect_assets()
             self.verify_assets(self.prefix)
             self.extract_assets()
-            self.implement_assets()
+            asyncio.run(self.implement_assets())
 
             cmds.inViewMessage(
                 amg="Published Successfully!", pos="midCenter", fade=True
@@ -82,12 +212,53 @@ class MyPublisher:
             raise PublishError("No selections founded.")
 
         # Collects the scene name.
-        name = cmds.file(query=True, exn=True)
-        self.scene = name.split("/")[-1]
+        self.scene = self._scene_info.file_name
 
         print(f"-- Collecting Done {self.scene}--")
         return True
 
+    def selection_list(self):
+        """
+        Description:
+        Builds an API selection list of the objects without touching Maya's selection.
+
+        Input:
+        None
+
+        Output:
+        sel (om2.MSelectionList): Selection list of the publish objects.
+        """
+        sel = om2.MSelectionList()
+        for obj in self.sel:
+            sel.add(obj)
+        return sel
+
+    @functools.cached_property
+    def _scene_info(self):
+        """
+        Description:
+        Queries the scene path once and splits it for the publish steps.
+
+        Input:
+        None
+
+        Output:
+        SceneInfo (namedtuple): File name, base name, version and project folder.
+        """
+        scene_path = cmds.file(q=True, sn=True)
+        if not scene_path:
+            raise PublishError("Save the scene before publishing.")
+
+        # The scene lives in <project>/scenes/, the project is two levels up.
+        path = pathlib.Path(scene_path)
+        base_name = path.name.split(".")[0]
+        return SceneInfo(
+            file_name=path.name,
+            base_name=base_name,
+            version=base_name.split("_")[-1],
+            project_dir=path.parents[1],
+        )
+
     def verify_assets(self, prefix):
         """
         Description:
@@ -99,33 +270,29 @@ class MyPublisher:
         Output:
         True/PublishError (Bool): Either pass as true or raises the error of wrong naming.
         """
-        # Makes an empty list and sets the naming convention spaces.
-        wrong_names = []
-        length = [3, 4]
+        # Makes an empty set and gets the naming convention.
+        wrong_names = set()
+        pattern = name_pattern(prefix)
 
         # Checks the length of the file scene name.
-        scene_length = self.scene.split("_")
-        if len(scene_length) not in length:
+        if not self.SCENE_PATTERN.fullmatch(self.scene):
             raise PublishError(
                 f"Wrong naming convention for your file name {self.scene}"
             )
 
-        # Verifies spaces for each name.
+        # Verifies the preffix and spaces for each name.
         for obj in self.sel:
-            node_name = obj.split("|")[-1]
-            parts = node_name.split("_")
-
-            # It appends it to wrong names for each object.
-            if len(parts) not in length:
-                wrong_names.append(obj)
-
-            # Verifies the preffix is in the selections.
-            if parts[0] != prefix:
-                wrong_names.append(obj)
+            node_name = obj.rsplit("|", 1)[-1]
+            if not pattern.fullmatch(node_name):
+                wrong_names.add(obj)
+                if self.fast_fail:
+                    break
 
         # It raises the error.
         if wrong_names:
-            raise PublishError(f"Naming standard is not right for: {wrong_names}")
+            raise PublishError(
+                f"Naming standard is not right for: {sorted(wrong_names)}"
+            )
         return True
 
     def extract_assets(self):
@@ -137,7 +304,7 @@ class MyPublisher:
         # Extracts and exports the assets
         pass
 
-    def implement_assets(self):
+    async def implement_assets(self):
         """
         Description: Initializes the implement_assets module as a base class.
         Input: None
@@ -146,10 +313,20 @@ class MyPublisher:
         # Publishes the path in shotgrid.
         pass
 
-    def discord_notification(self, asset_name, version, department, bot_url):
+    async def shotgrid_publisher(self, asset_data):
+        """
+        Description: Initializes the shotgrid publish module as a base class.
+        Input: asset_data (dict): Metadata of the published asset.
+        Output: None
+        """
+        # Posts the asset data to self.publish_api once it is wired up.
+        pass
+
+    async def discord_notification(self, asset_name, version, department, bot_url):
         """
         Description:
         Publishes a message to the Discord bot using enviroment variables.
+        The request runs on a helper thread so the event loop is not blocked.
 
         Input:
         asset_name (str): Name of the published asset.
@@ -180,8 +357,31 @@ class MyPublisher:
         }
 
         # Runts the message publishment.
+        await asyncio.to_thread(self.post_notification, bot_url, message)
+        return message
+
+    def post_notification(self, bot_url, message):
+        """
+        Description:
+        Posts the message through the shared session, creating it on first use.
+        Runs on a helper thread so the import and the request stay off the loop.
+
+        Input:
+        bot_url(str): URL of the discord bot that notifies the server.
+        message (dict): The discord message to publish.
+
+        Output:
+        None
+        """
+        # Imported on first publish to keep the tool light to load.
+        import requests
+
+        # Creates the pooled session once and reuses it on every publish.
+        if MyPublisher.http is None:
+            MyPublisher.http = self.create_session()
+
         try:
-            response = requests.post(bot_url, json=message)
+            response = MyPublisher.http.post(bot_url, json=message, timeout=(3.05, 10))
             response.raise_for_status()
             print("Discord notification sent.")
 
@@ -189,19 +389,24 @@ class MyPublisher:
         except requests.exceptions.RequestException as e:
             print(f"Discord notification failed: {e}")
 
-        return message
-
     def csv_publisher(self, asset_data):
-        current_path = pathlib.Path(self.obj_path)
-        db_path = str(current_path.with_suffix("")) + "_metadata.json"
-        # print(db_path)
-        with open(db_path, "w") as f:
-            json.dump(asset_data, f, indent=4)
-        # print(f"Registered at {db_path}")
+        # Serializes once and writes the file in a single call.
+        payload = json.dumps(asset_data, indent=4, ensure_ascii=False)
+        pathlib.Path(self.metadata_path).write_text(payload, encoding="utf-8")
+        # print(f"Registered at {self.metadata_path}")
         return asset_data
 
 
 class ModelPublisher(MyPublisher):
+    # Error header for each kind of validation failure, in report order.
+    FAILURE_MESSAGES = {
+        "ngon": "Ngons at",
+        "lamina": "Overlapping faces at",
+        "transform": "Transforms not frozen on",
+        "history": "These objects still contain history",
+        "uv": "These objects have no UVs",
+    }
+
     def verify_assets(self):
         """
         Description:
@@ -217,17 +422,9 @@ class ModelPublisher(MyPublisher):
         # Stores the name prefix sent.
         self.prefix = "geo"
         super().verify_assets(self.prefix)
-        # Verifies if the model has engons.
-        self.check_topology()
 
-        # Verifies freeze transforms and delet history.
-        self.check_transforms()
-
-        # Verifies spawn
-        self.check_history()
-
-        # Verifies UVs.
-        self.check_uvs()
+        # Verifies topology, freeze transforms, history and UVs in one pass.
+        self.raise_failures(self.validate_selection())
 
         print("--Verifying done---")
 
@@ -241,44 +438,36 @@ class ModelPublisher(MyPublisher):
 
         Output:
         self.obj_path (str): Destination path of the model.
+        self.metadata_path (str): Destination path of the metadata json.
         """
         print("-Starting Export-")
         # Exports the model as fbx or type of model to the destination.
-        # Ensures selection
-        cmds.select(self.sel)
-
-        # Grabs the location of the scene.
-        scene_path = cmds.file(q=True, sn=True)
-
-        # Grabs the name and the root path.
-        scenes_folder = pathlib.Path(scene_path)
-        # print(f"Pure_path is {scenes_folder}")
-        scene_dir = scenes_folder.parents[1]
-        # print(f"scene dir: {scene_dir}")
-        self.scene_name = os.path.basename(scene_path).split(".")[0]
-        # Get the file version.
-        self.version = self.scene_name.split("_")[-1]
-        # print(f"Scene root name {os.path.basename(scene_dir)}")
+        # Grabs the name, version and root path collected for the scene.
+        scene_info = self._scene_info
+        self.scene_name = scene_info.base_name
+        self.version = scene_info.version
 
         # Makes a new directory.
-        asset_folder = f"assets/{self.scene_name}/modeling/"
-        asset_dir = os.path.join(scene_dir, asset_folder)
-        os.makedirs(asset_dir, exist_ok=True)
+        asset_dir = scene_info.project_dir / "assets" / self.scene_name / "modeling"
+        asset_dir.mkdir(parents=True, exist_ok=True)
         # print(f"Assset dir is {asset_dir}")
 
         # Create path for the exports.
-        self.obj_path = os.path.join(asset_dir, self.scene_name)
+        self.obj_path = (asset_dir / self.scene_name).as_posix()
+        self.metadata_path = (
+            asset_dir / f"{self.scene_name}_metadata.json"
+        ).as_posix()
         # print(f"Export path {obj_path}")
 
-        # thumbnail_name = f"{scene_name}.jpg"
-        # thumbnail_path = os.path.join(asset_dir, thumbnail_name)
+        # thumbnail_path = asset_dir / f"{self.scene_name}.jpg"
 
-        # Exports the object.
-        cmds.file(self.obj_path, type=output, pr=True, es=True)
+        # Exports the object, the selection is only set for the export.
+        with maintained_selection(self.selection_list()):
+            cmds.file(self.obj_path, type=output, pr=True, es=True)
 
         print("--Export done--")
 
-    def implement_assets(self, description=""):
+    async def implement_assets(self, description=""):
         """
         Description: Implements the extracted asssets into a database and notifies.
 
@@ -286,18 +475,21 @@ class ModelPublisher(MyPublisher):
 
         Output:
         """
+        from datetime import datetime
+        from uuid import uuid4
+
         # Gets the enviroment path of discord.
         bot = os.environ.get("PIPELINE_DISCORD_BOT")
         # print(bot)
         # Defines the department.
         department = "modeling"
 
-        # Publishes the notification and the csv.
-        self.discord_notification(self.scene_name, self.version, department, bot)
+        # Gets the user name for the metadata.
+        self.user = getpass.getuser()
 
         # Gets the current date
-        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-        unique_hash = uuid.uuid4().hex[:8].upper()
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        unique_hash = uuid4().hex[:8].upper()
 
         # Establishes the dictionary.
         asset_data = {
@@ -309,53 +501,228 @@ class ModelPublisher(MyPublisher):
             "user": self.user,
             "description": description,
         }
+        # Publishes the notification, shotgrid and the csv at the same time.
         print("csv printing")
-        self.csv_publisher(asset_data)
+        results = await asyncio.gather(
+            self.discord_notification(self.scene_name, self.version, department, bot),
+            self.shotgrid_publisher(asset_data),
+            asyncio.to_thread(self.csv_publisher, asset_data),
+            return_exceptions=True,
+        )
         print("done csv")
 
-    def check_topology(self):
+        # Raises every failure once all the tasks have finished.
+        errors = [result for result in results if isinstance(result, Exception)]
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise PublishError(
+                "Implement failed: " + "; ".join(repr(error) for error in errors)
+            ) from errors[0]
+
+    def validate_selection(self):
         """
         Description:
-        Checks the selection model for any ngons or double faces.
+        Runs every geometry check in a single traversal of the selection.
 
         Input:
-        none
+        None
 
         Output:
-        none
+        failures (list): (kind, item) tuples for every failed check.
+        """
+        failures = []
+        for dag in self._selected_paths():
+            failures.extend(self._validate_one(dag))
+        return failures
+
+    def _selected_paths(self):
+        """
+        Description:
+        Yields the DAG path of every object in the publish selection.
+
+        Input:
+        None
+
+        Output:
+        dag (om2.MDagPath): Path of each selected object.
+        """
+        # Builds the selection list once for every object.
+        sel = self.selection_list()
+        for i in range(sel.length()):
+            yield sel.getDagPath(i)
+
+    def _meshes(self, dag):
+        """
+        Description:
+        Yields every non intermediate mesh shape under an object.
+
+        Input:
+        dag (om2.MDagPath): Path of the selected object.
+
+        Output:
+        mesh (om2.MDagPath): Path of each mesh shape.
+        """
+        it = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kMesh)
+        it.reset(dag, om2.MItDag.kDepthFirst, om2.MFn.kMesh)
+        while not it.isDone():
+            mesh = it.getPath()
+            if not om2.MFnDagNode(mesh).isIntermediateObject:
+                yield mesh
+            it.next()
+
+    def _validate_one(self, dag):
+        """
+        Description:
+        Checks the transforms, history, UVs and topology of one object.
+
+        Input:
+        dag (om2.MDagPath): Path of the selected object.
+
+        Output:
+        failures (list): (kind, item) tuples for every failed check.
+        """
+        failures = []
+        obj = dag.partialPathName()
+
+        # Verifies freeze transforms.
+        if dag.node().hasFn(om2.MFn.kTransform):
+            channel = self._unfrozen_channel(om2.MFnTransform(dag))
+            if channel:
+                failures.append(("transform", f"{obj} ({channel})"))
+
+        has_history = False
+        no_uvs = False
+
+        # Verifies ngons, lamina faces, history and UVs on every mesh under the object.
+        for mesh in self._meshes(dag):
+            failures.extend(self._check_polygons(mesh))
+            has_history = has_history or self._has_history(mesh.node())
+            no_uvs = no_uvs or om2.MFnMesh(mesh).numUVs() == 0
+
+        if has_history:
+            failures.append(("history", obj))
+        if no_uvs:
+            failures.append(("uv", obj))
+
+        return failures
+
+    def _has_history(self, node):
+        """
+        Description:
+        Checks if construction history feeds the mesh shape.
+
+        Input:
+        node (om2.MObject): Mesh shape node to check.
+
+        Output:
+        Bool: True if anything is connected into the inMesh of the shape.
+        """
+        # Display layers, keys and shading connect elsewhere, only inMesh is history.
+        plug = om2.MFnDependencyNode(node).findPlug("inMesh", False)
+        return plug.isDestination
+
+    def _unfrozen_channel(self, xf, tol=0.001):
         """
-        # Reselects and verifies for ngons
-        cmds.select(self.sel)
+        Description:
+        Finds the first transform channel that is not frozen.
 
-        # Filters the selection to meshes.
-        meshes = cmds.ls(self.sel, dag=True, type="mesh", long=True)
+        Input:
+        xf (om2.MFnTransform): Function set of the object.
+        tol (float): Allowed difference from the identity values.
 
-        # Selects the meshes.
-        cmds.select(meshes)
+        Output:
+        channel (str): Translate, Rotate or Scale. None if it is frozen.
+        """
+        # Check Translation
+        t = xf.translation(om2.MSpace.kTransform)
+        if any(abs(v) > tol for v in (t.x, t.y, t.z)):
+            return "Translate"
 
-        # Checks for ngons in the faces.
-        cmds.polySelectConstraint(mode=3, type=8, size=3)
+        # Check Rotation, the API returns it in radians.
+        r = xf.rotation(asQuaternion=False)
+        if any(abs(v) > math.radians(tol) for v in (r.x, r.y, r.z)):
+            return "Rotate"
 
-        # Adds engons to the list
-        ngons = cmds.ls(sl=True)
+        # Check Scale
+        if any(abs(v - 1.0) > tol for v in xf.scale()):
+            return "Scale"
 
-        # Comes out of the face selection.
-        cmds.polySelectConstraint(disable=True)
-        if ngons:
-            raise PublishError(f"Ngons at: {ngons}")
+        return None
 
-        # Creates an empty list to store lamina objects.
-        lamina_objs = []
+    def _check_polygons(self, mesh):
+        """
+        Description:
+        Walks the faces of a mesh once looking for ngons and lamina faces.
 
-        # Check for lamina faces and appends it if so.
-        for obj in meshes:
-            lamina = cmds.polyInfo(obj, laminaFaces=True)
-            if lamina:
-                lamina_objs.append(obj)
+        Input:
+        mesh (om2.MDagPath): Path of the mesh shape.
 
-        # Publishes if an error.
-        if lamina_objs:
-            raise PublishError(f"Overlapping faces at: {lamina_objs}")
+        Output:
+        failures (list): (kind, item) tuples for every failed check.
+        """
+        failures = []
+        name = mesh.fullPathName()
+        ngons = []
+        has_lamina = False
+
+        it = om2.MItMeshPolygon(mesh)
+        while not it.isDone():
+            # Adds engons to the list
+            if it.polygonVertexCount() > 4:
+                ngons.append(it.index())
+
+            # Check for lamina faces.
+            if not has_lamina and it.isLamina():
+                has_lamina = True
+            it.next()
+
+        # Reports the ngons as compact face ranges like cmds.ls does.
+        failures.extend(("ngon", f"{name}.{faces}") for faces in face_ranges(ngons))
+        if has_lamina:
+            failures.append(("lamina", name))
+        return failures
+
+    def raise_failures(self, failures):
+        """
+        Description:
+        Raises one PublishError listing every failure, grouped by kind.
+
+        Input:
+        failures (list): (kind, item) tuples from the checks.
+
+        Output:
+        None
+        """
+        grouped = {}
+        for kind, item in failures:
+            grouped.setdefault(kind, []).append(item)
+
+        if grouped:
+            raise PublishError(
+                "\n".join(
+                    f"{header}: {grouped[kind]}"
+                    for kind, header in self.FAILURE_MESSAGES.items()
+                    if kind in grouped
+                )
+            )
+
+    def check_topology(self):
+        """
+        Description:
+        Checks the selection model for any ngons or double faces.
+
+        Input:
+        none
+
+        Output:
+        none
+        """
+        failures = []
+        for dag in self._selected_paths():
+            for mesh in self._meshes(dag):
+                failures.extend(self._check_polygons(mesh))
+        self.raise_failures(failures)
 
     def check_transforms(self):
         """
@@ -366,50 +733,29 @@ class ModelPublisher(MyPublisher):
 
         Output: None
         """
-        # Makes an empty list to append.
-        bad_transforms = []
-        # It checks each selection.
-        for obj in self.sel:
-            # Check Translation
-            t = cmds.getAttr(f"{obj}.translate")[0]
-            # We verify the translation is frozen.
-            if abs(t[0]) > 0.001 or abs(t[1]) > 0.001 or abs(t[2]) > 0.001:
-                bad_transforms.append(f"{obj} (Translate)")
-                continue
-
-            # Check Rotation
-            r = cmds.getAttr(f"{obj}.rotate")[0]
-            if abs(r[0]) > 0.001 or abs(r[1]) > 0.001 or abs(r[2]) > 0.001:
-                bad_transforms.append(f"{obj} (Rotate)")
-                continue
-
-            # Check Scale
-            s = cmds.getAttr(f"{obj}.scale")[0]
-            if (
-                abs(s[0] - 1.0) > 0.001
-                or abs(s[1] - 1.0) > 0.001
-                or abs(s[2] - 1.0) > 0.001
-            ):
-                bad_transforms.append(f"{obj} (Scale)")
+        failures = []
+        for dag in self._selected_paths():
+            if not dag.node().hasFn(om2.MFn.kTransform):
                 continue
-
-        # Raise error ONCE at the end
-        if bad_transforms:
-            raise PublishError(f"Transforms not frozen on: {bad_transforms}")
+            channel = self._unfrozen_channel(om2.MFnTransform(dag))
+            if channel:
+                failures.append(("transform", f"{dag.partialPathName()} ({channel})"))
+        self.raise_failures(failures)
 
     def check_history(self):
         """
-        Docstring for check_history
+        Description:
+        Checks the selected objects do not contain construction history.
 
-        :param self: Description
+        Input: None
+
+        Output: None
         """
-        bad_obj = []
-        for obj in self.sel:
-            history = cmds.listHistory(obj, pruneDagObjects=True)
-            if history is not None:
-                bad_obj.append(obj)
-        if bad_obj:
-            raise PublishError(f"These objects still contain history: {bad_obj}")
+        failures = []
+        for dag in self._selected_paths():
+            if any(self._has_history(mesh.node()) for mesh in self._meshes(dag)):
+                failures.append(("history", dag.partialPathName()))
+        self.raise_failures(failures)
 
     def check_uvs(self):
         """
@@ -421,12 +767,11 @@ class ModelPublisher(MyPublisher):
         Output:
         None
         """
-        for obj in self.sel:
-            # Check if the object simply has UVs
-            uv_counts = cmds.polyEvaluate(obj, uv=True)
-
-            if uv_counts == 0:
-                raise PublishError(f"Object {obj} has no UVs!")
+        failures = []
+        for dag in self._selected_paths():
+            if any(om2.MFnMesh(mesh).numUVs() == 0 for mesh in self._meshes(dag)):
+                failures.append(("uv", dag.partialPathName()))
+        self.raise_failures(failures)
 
 
 class PublishError(Exception):